@@ -4,25 +4,58 @@ Scaffold a new Claude Code hook with proper structure.
 
 Usage:
     python3 scaffold-hook.py <event> <name> [--lang=python|bash]
+    python3 scaffold-hook.py --spec hooks.json
+
+Options:
+    --lang {python,bash}   Script language (default: python)
+    --description TEXT     Hook description
+    --output DIR           Output directory (default: .claude/hooks)
+    --spec FILE            JSON file with a list of hooks to scaffold in one run
 
 Examples:
     python3 scaffold-hook.py PreToolUse validate-bash
     python3 scaffold-hook.py SessionStart load-context --lang=bash
     python3 scaffold-hook.py Stop ensure-tests
+
+Spec file format (--spec):
+    [
+      {"event": "PreToolUse", "name": "validate-bash"},
+      {"event": "Stop", "name": "ensure-tests", "lang": "bash", "description": "..."}
+    ]
 """
 
-import argparse
 import os
-import stat
+import string
 import sys
-from datetime import datetime
 
-PYTHON_TEMPLATE = '''#!/usr/bin/env python3
+
+class HookTemplate(string.Template):
+    """Template that only substitutes its own ``${placeholder}`` names.
+
+    Bare ``$VAR`` and braced shell expansions such as ``${HOME}`` or
+    ``${1:-x}`` are left untouched, so shell code in the bash template
+    doesn't need escaping. Compiled once at import time.
+    """
+
+    flags = 0  # case-sensitive: string.Template defaults to re.IGNORECASE
+    pattern = r"""
+    \$(?:
+      (?P<escaped>(?!))                  |  # no escape sequence
+      (?P<named>(?!))                    |  # bare $name is left alone
+      \{(?P<braced>                         # ${placeholder}, ours only
+        name|description|event|matcher_line|date|event_specific_code
+      )\}                                 |
+      (?P<invalid>(?!))
+    )
+    """
+
+
+PYTHON_TEMPLATE = HookTemplate('''#!/usr/bin/env python3
 """
-{name} - {description}
+${name} - ${description}
 
-Event: {event}
-{matcher_line}Created: {date}
+Event: ${event}
+${matcher_line}Created: ${date}
 """
 
 import json
@@ -33,11 +66,11 @@ def main():
     try:
         input_data = json.load(sys.stdin)
     except json.JSONDecodeError as e:
-        print(f"Error: Invalid JSON input: {{e}}", file=sys.stderr)
+        print(f"Error: Invalid JSON input: {e}", file=sys.stderr)
         sys.exit(0)
 
     event = input_data.get("hook_event_name", "")
-{event_specific_code}
+${event_specific_code}
     # TODO: Add your logic here
 
     sys.exit(0)
@@ -45,13 +78,13 @@ def main():
 
 if __name__ == "__main__":
     main()
-'''
+''')
 
-BASH_TEMPLATE = '''#!/bin/bash
-# {name} - {description}
+BASH_TEMPLATE = HookTemplate('''#!/bin/bash
+# ${name} - ${description}
 #
-# Event: {event}
-# {matcher_line}Created: {date}
+# Event: ${event}
+# ${matcher_line}Created: ${date}
 
 set -e
 
@@ -59,16 +92,16 @@ set -e
 INPUT=$(cat)
 
 # Parse JSON fields (requires python3)
-parse_json() {{
+parse_json() {
     echo "$INPUT" | python3 -c "import sys,json; print(json.load(sys.stdin).get('$1',''))" 2>/dev/null || echo ""
-}}
+}
 
 EVENT=$(parse_json "hook_event_name")
-{event_specific_code}
+${event_specific_code}
 # TODO: Add your logic here
 
 exit 0
-'''
+''')
 
 EVENT_CODE = {
     "PreToolUse": {
@@ -216,116 +249,195 @@ TYPE=$(parse_json "notification_type")  # permission_prompt, idle_prompt, etc.
     },
 }
 
+# Flattened (event, lang) -> code lookup, built once at import
+EVENT_CODE_FLAT = {
+    (event, lang): code
+    for event, by_lang in EVENT_CODE.items()
+    for lang, code in by_lang.items()
+}
+
+# Per-language settings: template, file extension, interpreter command,
+# and placeholder for events without specific example code
+LANG_CFG = {
+    "python": {
+        "template": PYTHON_TEMPLATE,
+        "ext": ".py",
+        "cmd": "python3",
+        "default_code": "    # Event-specific code goes here\n",
+    },
+    "bash": {
+        "template": BASH_TEMPLATE,
+        "ext": ".sh",
+        "cmd": "bash",
+        "default_code": "# Event-specific code goes here\n",
+    },
+}
 
-def get_matcher_events():
-    """Events that support matchers."""
-    return ["PreToolUse", "PostToolUse", "PermissionRequest", "SessionStart", "PreCompact", "Notification"]
+VALID_EVENTS = frozenset({
+    "PreToolUse", "PostToolUse", "PermissionRequest",
+    "UserPromptSubmit", "Stop", "SubagentStop",
+    "SessionStart", "SessionEnd", "PreCompact", "Notification",
+})
 
+# Events that support matchers
+MATCHER_EVENTS = frozenset({
+    "PreToolUse", "PostToolUse", "PermissionRequest", "SessionStart", "PreCompact", "Notification",
+})
 
-def main():
-    parser = argparse.ArgumentParser(description="Scaffold a new Claude Code hook")
-    parser.add_argument("event", help="Hook event type (PreToolUse, PostToolUse, Stop, etc.)")
-    parser.add_argument("name", help="Hook name (e.g., validate-bash)")
-    parser.add_argument("--lang", choices=["python", "bash"], default="python", help="Script language")
-    parser.add_argument("--description", default="TODO: Add description", help="Hook description")
-    parser.add_argument("--output", help="Output directory (default: .claude/hooks)")
 
-    args = parser.parse_args()
+def scaffold_one(event: str, name: str, lang: str, description: str, today: str, output_dir: str) -> str:
+    """Render and write a single hook script. Returns the created path.
 
-    # Validate event type
-    valid_events = [
-        "PreToolUse", "PostToolUse", "PermissionRequest",
-        "UserPromptSubmit", "Stop", "SubagentStop",
-        "SessionStart", "SessionEnd", "PreCompact", "Notification"
-    ]
-    if args.event not in valid_events:
-        print(f"Error: Invalid event '{args.event}'", file=sys.stderr)
-        print(f"Valid events: {', '.join(valid_events)}", file=sys.stderr)
-        sys.exit(1)
+    Raises FileExistsError if the target already exists.
+    """
+    cfg = LANG_CFG[lang]
 
     # Generate matcher line
     matcher_line = ""
-    if args.event in get_matcher_events():
+    if event in MATCHER_EVENTS:
         matcher_line = "Matcher: TODO (e.g., Write|Edit, Bash, *)\n"
 
     # Get event-specific code
-    event_code = EVENT_CODE.get(args.event, {}).get(args.lang, "")
-    if not event_code:
-        event_code = "    # Event-specific code goes here\n" if args.lang == "python" else "# Event-specific code goes here\n"
-
-    # Select template
-    template = PYTHON_TEMPLATE if args.lang == "python" else BASH_TEMPLATE
+    event_code = EVENT_CODE_FLAT.get((event, lang), cfg["default_code"])
 
     # Generate content
-    content = template.format(
-        name=args.name,
-        description=args.description,
-        event=args.event,
+    content = cfg["template"].substitute(
+        name=name,
+        description=description,
+        event=event,
         matcher_line=matcher_line,
-        date=datetime.now().strftime("%Y-%m-%d"),
+        date=today,
         event_specific_code=event_code,
     )
 
     # Determine output path
-    ext = ".py" if args.lang == "python" else ".sh"
-    output_dir = args.output or ".claude/hooks"
-    output_path = os.path.join(output_dir, f"{args.name}{ext}")
+    output_path = os.path.join(output_dir, f"{name}{cfg['ext']}")
 
     # Create directory if needed
     os.makedirs(output_dir, exist_ok=True)
 
-    # Check if file exists
-    if os.path.exists(output_path):
-        print(f"Error: File already exists: {output_path}", file=sys.stderr)
+    # Create the file executable in one step; O_EXCL refuses to overwrite.
+    # Bytes are written as-is (no text-mode newline translation), so the
+    # script keeps LF line endings on every platform.
+    content_bytes = content.encode("utf-8")
+    fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o755)
+    try:
+        os.write(fd, content_bytes)
+    finally:
+        os.close(fd)
+
+    return output_path
+
+
+def print_next_steps(event: str, lang: str, output_path: str):
+    """Print next steps and settings snippet in a single write."""
+    import json
+
+    hook_entry = {
+        "type": "command",
+        "command": f'{LANG_CFG[lang]["cmd"]} "$CLAUDE_PROJECT_DIR"/{output_path}',
+    }
+    block = {}
+    if event in MATCHER_EVENTS:
+        block["matcher"] = "Write|Edit"
+    block["hooks"] = [hook_entry]
+    settings = {"hooks": {event: [block]}}
+    sys.stdout.write(
+        f"Created: {output_path}\n"
+        "\n"
+        "Next steps:\n"
+        f"1. Edit {output_path} to add your logic\n"
+        "2. Add to .claude/settings.json:\n"
+        "\n"
+        f"{json.dumps(settings, indent=2)}\n"
+    )
+
+
+def load_spec(spec_path: str, default_lang: str, default_description: str) -> list[dict]:
+    """Load a JSON spec file: a list of {event, name, lang, description} entries."""
+    import json
+
+    try:
+        with open(spec_path) as f:
+            entries = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"Error: Cannot read spec file {spec_path}: {e}", file=sys.stderr)
         sys.exit(1)
 
-    # Write file
-    with open(output_path, "w") as f:
-        f.write(content)
-
-    # Make executable
-    os.chmod(output_path, os.stat(output_path).st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
-
-    print(f"Created: {output_path}")
-    print()
-    print("Next steps:")
-    print(f"1. Edit {output_path} to add your logic")
-    print("2. Add to .claude/settings.json:")
-    print()
-
-    # Generate settings snippet
-    settings_matcher = '"Write|Edit"' if args.event in get_matcher_events() else ""
-    if settings_matcher:
-        print(f'''{{
-  "hooks": {{
-    "{args.event}": [
-      {{
-        "matcher": {settings_matcher},
-        "hooks": [
-          {{
-            "type": "command",
-            "command": "{'python3' if args.lang == 'python' else 'bash'} \\"$CLAUDE_PROJECT_DIR\\"/{output_path}"
-          }}
-        ]
-      }}
-    ]
-  }}
-}}''')
+    if not isinstance(entries, list):
+        print(f"Error: Spec file must contain a JSON list: {spec_path}", file=sys.stderr)
+        sys.exit(1)
+
+    specs = []
+    for i, entry in enumerate(entries):
+        if not isinstance(entry, dict) or not entry.get("event") or not entry.get("name"):
+            print(f"Error: Spec entry {i} needs at least 'event' and 'name'", file=sys.stderr)
+            sys.exit(1)
+        spec = {
+            "event": entry["event"],
+            "name": entry["name"],
+            "lang": entry.get("lang", default_lang),
+            "description": entry.get("description", default_description),
+        }
+        for key, value in spec.items():
+            if not isinstance(value, str):
+                print(f"Error: Spec entry {i}: '{key}' must be a string", file=sys.stderr)
+                sys.exit(1)
+        if spec["event"] not in VALID_EVENTS:
+            print(f"Error: Spec entry {i}: invalid event '{spec['event']}'", file=sys.stderr)
+            sys.exit(1)
+        if spec["lang"] not in LANG_CFG:
+            print(f"Error: Spec entry {i}: invalid lang '{spec['lang']}'", file=sys.stderr)
+            sys.exit(1)
+        specs.append(spec)
+
+    return specs
+
+
+def main():
+    # Answer a bare --help from the docstring so it doesn't pay for
+    # importing argparse and datetime
+    if sys.argv[1:] in (["-h"], ["--help"]):
+        sys.stdout.write(__doc__.lstrip())
+        sys.exit(0)
+
+    import argparse
+    from datetime import datetime
+
+    today = datetime.now().strftime("%Y-%m-%d")
+
+    parser = argparse.ArgumentParser(description="Scaffold a new Claude Code hook")
+    parser.add_argument("event", nargs="?", choices=sorted(VALID_EVENTS), metavar="event",
+                        help="Hook event type (PreToolUse, PostToolUse, Stop, etc.)")
+    parser.add_argument("name", nargs="?", help="Hook name (e.g., validate-bash)")
+    parser.add_argument("--lang", choices=list(LANG_CFG), default="python", help="Script language")
+    parser.add_argument("--description", default="TODO: Add description", help="Hook description")
+    parser.add_argument("--output", help="Output directory (default: .claude/hooks)")
+    parser.add_argument("--spec", help="JSON file with a list of {event, name, lang, description} to scaffold in one run")
+
+    args = parser.parse_args()
+    output_dir = args.output or ".claude/hooks"
+
+    if args.spec:
+        if args.event or args.name:
+            parser.error("event and name cannot be combined with --spec")
+        specs = load_spec(args.spec, args.lang, args.description)
+    elif args.event and args.name:
+        specs = [{"event": args.event, "name": args.name, "lang": args.lang, "description": args.description}]
     else:
-        print(f'''{{
-  "hooks": {{
-    "{args.event}": [
-      {{
-        "hooks": [
-          {{
-            "type": "command",
-            "command": "{'python3' if args.lang == 'python' else 'bash'} \\"$CLAUDE_PROJECT_DIR\\"/{output_path}"
-          }}
-        ]
-      }}
-    ]
-  }}
-}}''')
+        parser.error("event and name are required (or use --spec)")
+
+    failed = False
+    for spec in specs:
+        try:
+            output_path = scaffold_one(today=today, output_dir=output_dir, **spec)
+        except FileExistsError as e:
+            print(f"Error: File already exists: {e.filename}", file=sys.stderr)
+            failed = True
+            continue
+        print_next_steps(spec["event"], spec["lang"], output_path)
+
+    sys.exit(1 if failed else 0)
 
 
 if __name__ == "__main__":
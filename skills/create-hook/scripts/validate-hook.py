@@ -7,7 +7,7 @@ This linter ensures hooks are properly installed and will run when Claude restar
 Checks:
 1. Hook script exists and is executable
 2. Has valid shebang (#!/usr/bin/env python3 or #!/bin/bash)
-3. No syntax errors (Python AST or bash -n)
+3. No syntax errors (Python compile or bash -n)
 4. Handles JSON input from stdin
 5. Returns valid exit codes (0, 1, or 2)
 6. Settings.json references the hook correctly
@@ -31,6 +31,12 @@ Usage:
     # Full project validation (settings + all hooks + installation report)
     python3 validate-hook.py --project
 
+    # Machine-readable results (combine with any of the above)
+    python3 validate-hook.py --project --json
+
+    # Static checks only - never execute the hooks (e.g. in CI)
+    python3 validate-hook.py --all --skip-runtime
+
 Exit codes:
     0 - All validations passed
     1 - Validation errors found
@@ -38,16 +44,27 @@ Exit codes:
 """
 
 import argparse
-import ast
+import functools
+import io
 import json
 import os
 import re
+import select
+import shlex
 import subprocess
 import sys
-from dataclasses import dataclass, field
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Optional
 
+# orjson parses settings noticeably faster; its JSONDecodeError subclasses json's
+try:
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
 
 @dataclass
 class InstallationInfo:
@@ -80,82 +97,109 @@ class InstallationInfo:
         return "Will NOT run (not registered in any settings file)"
 
 
+# Report prefix for each check level
+_GLYPH = {"error": "❌", "warn": "⚠️ ", "ok": "✓", "info": "ℹ️ "}
+
+
 class ValidationResult:
     def __init__(self):
-        self.errors: list[str] = []
-        self.warnings: list[str] = []
-        self.passed: list[str] = []
+        # (level, message) pairs in the order checks ran; formatted only when printed
+        self.items: list[tuple[str, str]] = []
         self.installation: Optional[InstallationInfo] = None
 
     def error(self, msg: str):
-        self.errors.append(f"❌ {msg}")
+        self.items.append(("error", msg))
 
     def warn(self, msg: str):
-        self.warnings.append(f"⚠️  {msg}")
+        self.items.append(("warn", msg))
 
     def ok(self, msg: str):
-        self.passed.append(f"✓ {msg}")
+        self.items.append(("ok", msg))
 
     def info(self, msg: str):
-        self.passed.append(f"ℹ️  {msg}")
+        self.items.append(("info", msg))
+
+    @property
+    def errors(self) -> list[str]:
+        return [msg for level, msg in self.items if level == "error"]
+
+    @property
+    def warnings(self) -> list[str]:
+        return [msg for level, msg in self.items if level == "warn"]
+
+    @property
+    def passed(self) -> list[str]:
+        return [msg for level, msg in self.items if level in ("ok", "info")]
 
     @property
     def success(self) -> bool:
-        return len(self.errors) == 0
+        return all(level != "error" for level, _ in self.items)
 
-    def print_report(self, title: str):
-        print(f"\n{'='*60}")
-        print(f"  {title}")
-        print('='*60)
+    def to_dict(self) -> dict:
+        return {
+            "errors": self.errors,
+            "warnings": self.warnings,
+            "passed": self.passed,
+            "installation": asdict(self.installation) if self.installation else None,
+            "success": self.success,
+        }
 
-        for msg in self.passed:
-            print(f"  {msg}")
-        for msg in self.warnings:
-            print(f"  {msg}")
-        for msg in self.errors:
-            print(f"  {msg}")
+    def print_report(self, title: str):
+        # Build the whole report and write it once rather than a print per line
+        buf = io.StringIO()
+        print(f"\n{'='*60}", file=buf)
+        print(f"  {title}", file=buf)
+        print('='*60, file=buf)
+
+        # Passed checks first, then warnings, then errors
+        for group in (("ok", "info"), ("warn",), ("error",)):
+            for level, msg in self.items:
+                if level in group:
+                    print(f"  {_GLYPH[level]} {msg}", file=buf)
 
         # Print installation status if available
         if self.installation:
-            print()
-            print("  📍 INSTALLATION STATUS:")
+            print(file=buf)
+            print("  📍 INSTALLATION STATUS:", file=buf)
             if self.installation.project:
-                print("  ✓ Registered in PROJECT settings (.claude/settings.json)")
+                print("  ✓ Registered in PROJECT settings (.claude/settings.json)", file=buf)
             else:
-                print("  ✗ Not in project settings (.claude/settings.json)")
+                print("  ✗ Not in project settings (.claude/settings.json)", file=buf)
 
             if self.installation.local:
-                print("  ✓ Registered in LOCAL settings (.claude/settings.local.json)")
+                print("  ✓ Registered in LOCAL settings (.claude/settings.local.json)", file=buf)
             else:
-                print("  ✗ Not in local settings (.claude/settings.local.json)")
+                print("  ✗ Not in local settings (.claude/settings.local.json)", file=buf)
 
             if self.installation.user:
-                print("  ✓ Registered in USER settings (~/.claude/settings.json)")
+                print("  ✓ Registered in USER settings (~/.claude/settings.json)", file=buf)
             else:
-                print("  ✗ Not in user settings (~/.claude/settings.json)")
+                print("  ✗ Not in user settings (~/.claude/settings.json)", file=buf)
 
-            print()
+            print(file=buf)
             if self.installation.is_installed:
-                print(f"  ⚡ {self.installation.scope_description()}")
+                print(f"  ⚡ {self.installation.scope_description()}", file=buf)
                 if self.installation.events:
                     events_str = ", ".join(sorted(set(self.installation.events)))
-                    print(f"  🎯 Events: {events_str}")
+                    print(f"  🎯 Events: {events_str}", file=buf)
                 if self.installation.matchers:
                     matchers_str = ", ".join(sorted(set(self.installation.matchers)))
-                    print(f"  🔍 Matchers: {matchers_str}")
+                    print(f"  🔍 Matchers: {matchers_str}", file=buf)
             else:
-                print("  ⚠️  Hook script exists but is NOT registered in any settings file!")
-                print("     It will NOT run until added to settings.json")
+                print("  ⚠️  Hook script exists but is NOT registered in any settings file!", file=buf)
+                print("     It will NOT run until added to settings.json", file=buf)
 
-        print()
+        print(file=buf)
         if self.success:
             if self.installation and not self.installation.is_installed:
-                print(f"  ⚠️  SCRIPT VALID but NOT INSTALLED ({len(self.passed)} checks passed)")
+                print(f"  ⚠️  SCRIPT VALID but NOT INSTALLED ({len(self.passed)} checks passed)", file=buf)
             else:
-                print(f"  ✅ PASSED ({len(self.passed)} checks, {len(self.warnings)} warnings)")
+                print(f"  ✅ PASSED ({len(self.passed)} checks, {len(self.warnings)} warnings)", file=buf)
         else:
-            print(f"  ❌ FAILED ({len(self.errors)} errors, {len(self.warnings)} warnings)")
-        print()
+            print(f"  ❌ FAILED ({len(self.errors)} errors, {len(self.warnings)} warnings)", file=buf)
+        print(file=buf)
+
+        sys.stdout.write(buf.getvalue())
 
 
 # Event schemas - what fields each event provides
@@ -222,6 +266,10 @@ EVENT_SCHEMAS = {
     },
 }
 
+# Per-event flags looked up while walking settings
+_EVENT_HAS_MATCHER = {event: schema["has_matcher"] for event, schema in EVENT_SCHEMAS.items()}
+_EVENT_CAN_BLOCK = {event: schema["can_block"] for event, schema in EVENT_SCHEMAS.items()}
+
 # Test inputs for each event type
 TEST_INPUTS = {
     "PreToolUse": {
@@ -285,6 +333,10 @@ TEST_INPUTS = {
     },
 }
 
+# Test inputs serialized once, ready to pipe to a hook's stdin
+_TEST_INPUT_JSON = {event: json.dumps(test_input) for event, test_input in TEST_INPUTS.items()}
+_UNKNOWN_INPUT_JSON = json.dumps({"hook_event_name": "Unknown"})
+
 
 def get_settings_paths(project_dir: Path) -> dict[str, Path]:
     """Get all possible settings file paths."""
@@ -295,139 +347,538 @@ def get_settings_paths(project_dir: Path) -> dict[str, Path]:
     }
 
 
-def find_hook_in_settings(settings_path: Path, hook_script: Path, project_dir: Path) -> tuple[bool, list[str], list[str]]:
+@functools.lru_cache(maxsize=16)
+def _load_settings_cached(path_str: str, mtime_ns: int) -> dict:
+    """Parse a settings file. Keyed on mtime so edits are picked up."""
+    return _loads(Path(path_str).read_bytes())
+
+
+def load_settings(settings_path: Path) -> dict:
     """
-    Check if a hook script is registered in a settings file.
-    Returns (found, events, matchers).
+    Load a settings file, parsing each file at most once per run.
+    Raises OSError or json.JSONDecodeError.
     """
-    if not settings_path.exists():
-        return False, [], []
+    return _load_settings_cached(str(settings_path), settings_path.stat().st_mtime_ns)
 
+
+@functools.lru_cache(maxsize=512)
+def _resolve_cached(part: str) -> Optional[Path]:
+    """Resolve a command token to an absolute path, or None if it can't be."""
     try:
-        settings = json.loads(settings_path.read_text())
-    except (json.JSONDecodeError, OSError):
-        return False, [], []
+        return Path(part).resolve()
+    except (OSError, ValueError):
+        return None
+
 
-    hooks_config = settings.get("hooks", {})
-    if not hooks_config:
-        return False, [], []
+@functools.lru_cache(maxsize=256)
+def _tokenize(cmd: str) -> tuple[str, ...]:
+    """Split a command the way a POSIX shell would, falling back to whitespace."""
+    try:
+        return tuple(shlex.split(cmd, posix=True))
+    except ValueError:
+        # Unbalanced quotes: keep the old behaviour rather than failing
+        return tuple(cmd.replace('"', '').replace("'", '').split())
 
-    found = False
-    events = []
-    matchers = []
 
-    # Normalize hook script path for comparison
-    hook_name = hook_script.name
-    hook_abs = hook_script.resolve()
+def _command_tokens(command: str, project_dir: Path) -> tuple[str, ...]:
+    """Split a hook command into shell words with $CLAUDE_PROJECT_DIR expanded."""
+    # Expand $CLAUDE_PROJECT_DIR (handle both quoted and unquoted)
+    expanded = command.replace('"$CLAUDE_PROJECT_DIR"', str(project_dir))
+    expanded = expanded.replace("'$CLAUDE_PROJECT_DIR'", str(project_dir))
+    expanded = expanded.replace("$CLAUDE_PROJECT_DIR", str(project_dir))
 
-    for event, configs in hooks_config.items():
+    return _tokenize(expanded)
+
+
+def _iter_commands(settings: dict):
+    """Yield (event, matcher, command) for every command hook in parsed settings."""
+    for event, configs in settings.get("hooks", {}).items():
         for config in configs:
             matcher = config.get("matcher", "*")
-            hook_list = config.get("hooks", [])
-
-            for hook in hook_list:
+            for hook in config.get("hooks", []):
                 if hook.get("type", "command") != "command":
                     continue
-
                 command = hook.get("command", "")
-                if not command:
-                    continue
+                if command:
+                    yield event, matcher, command
+
+
+def _is_hook_name(name: str) -> bool:
+    """
+    Whether a file name in a hooks directory looks like a hook script (see find_all_hooks).
+    Compiled .pyc files are skipped; the installation check maps them to their .py source.
+    """
+    if name.endswith('.pyc'):
+        return False
+    return name.endswith(('.py', '.sh')) or name.startswith('hook')
 
-                # Expand $CLAUDE_PROJECT_DIR (handle both quoted and unquoted)
-                expanded = command.replace('"$CLAUDE_PROJECT_DIR"', str(project_dir))
-                expanded = expanded.replace("'$CLAUDE_PROJECT_DIR'", str(project_dir))
-                expanded = expanded.replace("$CLAUDE_PROJECT_DIR", str(project_dir))
-
-                # Check if this command references our hook by name
-                if hook_name in expanded:
-                    # Strip quotes and check each part
-                    # Remove quotes for path comparison
-                    clean_expanded = expanded.replace('"', '').replace("'", '')
-
-                    for part in clean_expanded.split():
-                        if hook_name in part:
-                            # Try path resolution
-                            try:
-                                cmd_path = Path(part).resolve()
-                                if cmd_path == hook_abs:
-                                    found = True
-                                    events.append(event)
-                                    if matcher != "*":
-                                        matchers.append(matcher)
-                                    break
-                            except (OSError, ValueError):
-                                pass
-
-                            # Fallback: string match on filename
-                            if part.endswith(hook_name):
-                                found = True
-                                events.append(event)
-                                if matcher != "*":
-                                    matchers.append(matcher)
-                                break
-
-    return found, events, matchers
+
+def _extract_script_paths(settings: dict, project_dir: Path) -> list[tuple[str, str, Path]]:
+    """
+    Flatten parsed settings into (event, matcher, resolved path) entries.
+    Every command word is kept, whatever its name, so extension-less hooks
+    still match by path or file name.
+    """
+    extracted = []
+    for event, matcher, command in _iter_commands(settings):
+        seen = set()
+        for part in _command_tokens(command, project_dir):
+            if part.endswith('.pyc'):
+                # Precompiled hook (compileall -b): attribute it to its source
+                part = part[:-1]
+            resolved = _resolve_cached(part)
+            if resolved is None or resolved in seen:
+                continue
+            seen.add(resolved)
+            extracted.append((event, matcher, resolved))
+    return extracted
+
+
+@functools.lru_cache(maxsize=16)
+def _script_paths_cached(path_str: str, mtime_ns: int, project_dir: Path) -> tuple[tuple[str, str, Path], ...]:
+    """Extract script paths from a settings file. Keyed on mtime so edits are picked up."""
+    return tuple(_extract_script_paths(_load_settings_cached(path_str, mtime_ns), project_dir))
+
+
+def load_all_script_paths(project_dir: Path) -> list[tuple[str, tuple[tuple[str, str, Path], ...]]]:
+    """Extracted script paths for every level that has a readable settings file."""
+    loaded = []
+    for level, settings_path in get_settings_paths(project_dir).items():
+        if not settings_path.exists():
+            continue
+        try:
+            mtime_ns = settings_path.stat().st_mtime_ns
+            loaded.append((level, _script_paths_cached(str(settings_path), mtime_ns, project_dir)))
+        except (json.JSONDecodeError, OSError):
+            continue
+    return loaded
+
+
+def find_hook_in_settings(
+    script_paths: tuple[tuple[str, str, Path], ...], hook_name: str, hook_abs: Path
+) -> tuple[bool, list[str], list[str]]:
+    """
+    Check if a hook script is registered, given one settings file's extracted script paths.
+    hook_abs is the already-resolved script path; returns (found, events, matchers).
+    """
+    # Path match, with a fallback string match on filename
+    matches = [
+        (event, matcher) for event, matcher, path in script_paths
+        if path == hook_abs or path.name == hook_name
+    ]
+    events = [event for event, _ in matches]
+    matchers = [matcher for _, matcher in matches if matcher != "*"]
+    return bool(matches), events, matchers
 
 
 def check_installation_status(hook_script: Path, project_dir: Path) -> InstallationInfo:
     """Check where a hook is registered across all settings levels."""
     info = InstallationInfo()
-    paths = get_settings_paths(project_dir)
 
-    # Check each level
-    found, events, matchers = find_hook_in_settings(paths["project"], hook_script, project_dir)
-    if found:
-        info.project = True
-        info.events.extend(events)
-        info.matchers.extend(matchers)
-
-    found, events, matchers = find_hook_in_settings(paths["local"], hook_script, project_dir)
-    if found:
-        info.local = True
-        info.events.extend(events)
-        info.matchers.extend(matchers)
-
-    found, events, matchers = find_hook_in_settings(paths["user"], hook_script, project_dir)
-    if found:
-        info.user = True
-        info.events.extend(events)
-        info.matchers.extend(matchers)
+    # Normalize hook script path for comparison
+    hook_name = hook_script.name
+    hook_abs = hook_script.resolve()
+
+    for level, script_paths in load_all_script_paths(project_dir):
+        found, events, matchers = find_hook_in_settings(script_paths, hook_name, hook_abs)
+        if found:
+            setattr(info, level, True)
+            info.events.extend(events)
+            info.matchers.extend(matchers)
 
     return info
 
 
+# One registration from the settings walk: (walk order, level, event, matcher, resolved path)
+_Registration = tuple[int, str, str, str, Path]
+
+
+def build_installation_index(project_dir: Path) -> dict[str, list[_Registration]]:
+    """
+    Group every script referenced from settings by file name.
+    Walks the settings once, so a whole project is checked without
+    re-scanning every settings file for every hook.
+    """
+    index: dict[str, list[_Registration]] = {}
+    order = 0
+
+    for level, script_paths in load_all_script_paths(project_dir):
+        for event, matcher, path in script_paths:
+            index.setdefault(path.name, []).append((order, level, event, matcher, path))
+            order += 1
+
+    return index
+
+
+def lookup_installation(index: dict[str, list[_Registration]], hook_script: Path) -> InstallationInfo:
+    """
+    Look a hook up in an installation index. Matches exactly like
+    find_hook_in_settings (resolved path, or the same file name), so the
+    result agrees with check_installation_status.
+    """
+    hook_name = hook_script.name
+    hook_abs = hook_script.resolve()
+    candidates = index.get(hook_name, [])
+    if hook_abs.name != hook_name:
+        # A symlinked hook can match by its target's path under another name
+        candidates = sorted(candidates + index.get(hook_abs.name, []))
+
+    info = InstallationInfo()
+    for _, level, event, matcher, path in candidates:
+        if path == hook_abs or path.name == hook_name:
+            setattr(info, level, True)
+            info.events.append(event)
+            if matcher != "*":
+                info.matchers.append(matcher)
+    return info
+
+
+# "Event: X" line in a hook's docstring/header comment
+_EVENT_RE = re.compile(r'Event:\s*(\w+)')
+
+# Field-access markers checked in order: (must contain all, must contain none, event)
+_EVENT_MARKERS = (
+    (("stop_hook_active",), (), "Stop"),
+    (("tool_response",), (), "PostToolUse"),
+    (("prompt",), ("tool_name",), "UserPromptSubmit"),
+    (("notification_type",), (), "Notification"),
+    (('"source"', "startup"), (), "SessionStart"),
+    (('"reason"',), ("tool_name",), "SessionEnd"),
+    (("tool_name",), (), "PreToolUse"),  # Default for tool-related hooks
+)
+
+
 def detect_hook_event(script_path: Path, content: str) -> Optional[str]:
     """Try to detect which event this hook is for from its content."""
     # Check docstring/comments
-    event_pattern = r'Event:\s*(\w+)'
-    match = re.search(event_pattern, content)
+    match = _EVENT_RE.search(content)
     if match:
         event = match.group(1)
         if event in EVENT_SCHEMAS:
             return event
 
     # Check for event-specific field access
-    if "stop_hook_active" in content:
-        return "Stop"
-    if "tool_response" in content:
-        return "PostToolUse"
-    if '"prompt"' in content or "prompt" in content:
-        if "tool_name" not in content:
-            return "UserPromptSubmit"
-    if "notification_type" in content:
-        return "Notification"
-    if '"source"' in content and "startup" in content:
-        return "SessionStart"
-    if '"reason"' in content and "tool_name" not in content:
-        return "SessionEnd"
-    if "tool_name" in content:
-        return "PreToolUse"  # Default for tool-related hooks
+    for required, excluded, event in _EVENT_MARKERS:
+        if all(n in content for n in required) and not any(n in content for n in excluded):
+            return event
 
     return None
 
 
-def validate_hook_script(script_path: Path, project_dir: Path, event_hint: Optional[str] = None) -> ValidationResult:
-    """Validate a single hook script and check its installation status."""
+# sys.exit(N) in Python or `exit N` in bash, for N in 0/1/2
+_EXIT_RE = re.compile(r'sys\.exit\(([012])\)|(?:^|\s)exit\s+([012])', re.M)
+
+# Heuristic checks (shebang, stdin handling, event markers, exit codes) only
+# look at the start of a script. The full file is read for Python (syntax check)
+# and before reporting a missing stop_hook_active check
+_HEAD_BYTES = 65536
+
+# (path, mtime_ns) -> syntax error description, or None if the script compiles
+_PY_SYNTAX_CACHE: dict[tuple[str, int], Optional[str]] = {}
+
+
+def check_python_syntax(script_path: Path, content: str) -> Optional[str]:
+    """Compile a Python hook without building an AST. Returns the error, if any."""
+    key = (str(script_path), script_path.stat().st_mtime_ns)
+    if key not in _PY_SYNTAX_CACHE:
+        try:
+            compile(content, str(script_path), "exec", dont_inherit=True)
+            _PY_SYNTAX_CACHE[key] = None
+        except SyntaxError as e:
+            _PY_SYNTAX_CACHE[key] = f"{e.msg} (line {e.lineno})"
+    return _PY_SYNTAX_CACHE[key]
+
+
+# Runs `bash -n` on each argument, printing NUL-separated (status, path, stderr) triples
+_BASH_SYNTAX_BATCH = (
+    'for f; do '
+    'if out=$(bash -n "$f" 2>&1); then printf "OK\\0%s\\0\\0" "$f"; '
+    'else printf "FAIL\\0%s\\0%s\\0" "$f" "$out"; fi; '
+    'done'
+)
+
+
+def check_bash_syntax_batch(scripts: list[Path]) -> dict[Path, Optional[str]]:
+    """
+    Syntax-check several bash scripts from a single bash process.
+    Returns {script: error message or None}. Scripts missing from the result
+    (e.g. the batch timed out) should be checked individually.
+    """
+    if not scripts:
+        return {}
+
+    try:
+        proc = subprocess.run(
+            ['bash', '-c', _BASH_SYNTAX_BATCH, '--', *map(str, scripts)],
+            capture_output=True,
+            text=True,
+            timeout=5 * len(scripts),
+        )
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return {}
+
+    fields = proc.stdout.split('\0')
+    results = {}
+    for i in range(0, len(fields) - 2, 3):
+        status, path, err = fields[i:i + 3]
+        results[Path(path)] = None if status == "OK" else err.strip()
+    return results
+
+
+# Runs Python hooks with runpy in a child forked per request, one JSON request
+# per line on the fd in argv[1]. The fork keeps the warm imports but gives every
+# hook a fresh process, so signal handlers, alarms, os.environ, atexit and
+# sys.modules never leak from one hook into the next. Replies go to a dedicated
+# pipe (fd in argv[2]) so output from the hook's own child processes can't
+# corrupt the framing.
+_PYTHON_WORKER_SRC = r'''
+import atexit, json, os, runpy, select, signal, sys, tempfile, time, traceback
+# Modules hooks commonly import; forked children inherit them already loaded
+import pathlib, re, subprocess
+
+requests = os.fdopen(int(sys.argv[1]), "r", encoding="utf-8")
+replies = os.fdopen(int(sys.argv[2]), "w", encoding="utf-8")
+# Frames from this worker and runpy, hidden from hook tracebacks
+WORKER_FILES = {"<string>", "<frozen runpy>", runpy.__file__}
+
+
+def run_child(path, files):
+    # Real files on fds 0-2, so hooks that use os.read/os.write or spawn children behave as in a fresh process
+    for fd, f in enumerate(files):
+        os.dup2(f.fileno(), fd)
+    sys.stdin = open(0, "r", encoding="utf-8", closefd=False)
+    sys.stdout = open(1, "w", encoding="utf-8", closefd=False)
+    sys.stderr = open(2, "w", encoding="utf-8", errors="backslashreplace", closefd=False)
+    sys.argv = [path]
+    sys.path.insert(0, os.path.dirname(path))
+    code = 0
+    try:
+        runpy.run_path(path, run_name="__main__")
+    except SystemExit as e:
+        if isinstance(e.code, int) or e.code is None:
+            code = e.code or 0
+        else:
+            print(e.code, file=sys.stderr)
+            code = 1
+    except BaseException as e:
+        # Start the traceback at the hook's own frames, as a fresh interpreter would
+        tb = e.__traceback__
+        while tb is not None and tb.tb_frame.f_code.co_filename in WORKER_FILES:
+            tb = tb.tb_next
+        traceback.print_exception(type(e), e, tb or e.__traceback__)
+        code = 1
+    # Finish like interpreter shutdown: join non-daemon threads, then run atexit handlers
+    threading = sys.modules.get("threading")
+    if threading is not None:
+        try:
+            threading._shutdown()
+        except BaseException:
+            traceback.print_exc()
+    atexit._run_exitfuncs()
+    for stream in (sys.stdout, sys.stderr):
+        try:
+            stream.flush()
+        except (OSError, ValueError):
+            pass
+    return code
+
+
+def wait_child(pid, timeout):
+    # Returns the exit code like subprocess does (negative for a signal), or None on timeout
+    deadline = time.monotonic() + timeout
+    try:
+        pidfd = os.pidfd_open(pid)
+    except (AttributeError, OSError):
+        pidfd = None
+    while True:
+        done, status = os.waitpid(pid, os.WNOHANG)
+        if done:
+            break
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            os.kill(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
+            status = None
+            break
+        if pidfd is not None:
+            select.select([pidfd], [], [], remaining)
+        else:
+            time.sleep(min(remaining, 0.005))
+    if pidfd is not None:
+        os.close(pidfd)
+    return None if status is None else os.waitstatus_to_exitcode(status)
+
+
+for line in requests:
+    req = json.loads(line)
+    files = [tempfile.TemporaryFile() for _ in range(3)]
+    files[0].write(req["input"].encode("utf-8"))
+    files[0].seek(0)
+    pid = os.fork()
+    if pid == 0:
+        code = 1
+        try:
+            requests.close()
+            replies.close()
+            code = run_child(req["path"], files)
+        finally:
+            os._exit(code)
+    code = wait_child(pid, req["timeout"])
+    output = []
+    for f in files:
+        f.seek(0)
+        output.append(f.read().decode("utf-8", "replace"))
+        f.close()
+    replies.write(json.dumps({
+        "returncode": code,
+        "stdout": output[1],
+        "stderr": output[2],
+    }) + "\n")
+    replies.flush()
+'''
+
+
+class PythonHookWorker:
+    """A long-lived python3 process that runtime-tests Python hooks without a fresh interpreter each."""
+
+    def __init__(self, env: dict[str, str]):
+        # Requests and replies use their own pipes; the hook gets fds 0-2 to itself
+        request_r, request_w = os.pipe()
+        reply_r, reply_w = os.pipe()
+        self.proc = subprocess.Popen(
+            ['python3', '-c', _PYTHON_WORKER_SRC, str(request_r), str(reply_w)],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            pass_fds=(request_r, reply_w),
+            env=env,
+        )
+        os.close(request_r)
+        os.close(reply_w)
+        self.requests = os.fdopen(request_w, "w", encoding="utf-8")
+        self.replies = os.fdopen(reply_r, encoding="utf-8")
+
+    def run(self, script_path: Path, input_json: str, timeout: float) -> tuple[int, str, str]:
+        """
+        Run a hook and return (returncode, stdout, stderr).
+        Raises subprocess.TimeoutExpired if the hook runs past timeout (the worker
+        kills it and stays usable), or RuntimeError if the worker itself died.
+        """
+        try:
+            self.requests.write(json.dumps({
+                "path": str(script_path),
+                "input": input_json,
+                "timeout": timeout,
+            }) + "\n")
+            self.requests.flush()
+        except OSError:
+            self.close()
+            raise RuntimeError("Python hook worker exited unexpectedly")
+
+        # The worker enforces the timeout itself; the margin only catches a hung worker
+        ready, _, _ = select.select([self.replies], [], [], timeout + 5)
+        if not ready:
+            self.close()
+            raise subprocess.TimeoutExpired(['python3', str(script_path)], timeout)
+
+        line = self.replies.readline()
+        if not line:
+            self.close()
+            raise RuntimeError("Python hook worker exited unexpectedly")
+        reply = json.loads(line)
+        if reply["returncode"] is None:
+            raise subprocess.TimeoutExpired(['python3', str(script_path)], timeout)
+        return reply["returncode"], reply["stdout"], reply["stderr"]
+
+    @property
+    def alive(self) -> bool:
+        return self.proc.poll() is None
+
+    def close(self):
+        if self.alive:
+            self.proc.kill()
+        self.proc.wait()
+        try:
+            self.requests.close()
+        except OSError:
+            pass
+        self.replies.close()
+
+
+def hook_env(project_dir: Path) -> dict[str, str]:
+    """Environment hooks run with: ours plus CLAUDE_PROJECT_DIR. Build once and reuse."""
+    env = os.environ.copy()
+    env["CLAUDE_PROJECT_DIR"] = str(project_dir)
+    return env
+
+
+class PythonWorkerPool:
+    """One PythonHookWorker per thread, started on first use."""
+
+    def __init__(self, env: dict[str, str]):
+        self.env = env
+        self.local = threading.local()
+        self.workers: list[PythonHookWorker] = []
+        self.lock = threading.Lock()
+
+    def get(self) -> PythonHookWorker:
+        worker = getattr(self.local, "worker", None)
+        if worker is None or not worker.alive:
+            worker = PythonHookWorker(self.env)
+            self.local.worker = worker
+            with self.lock:
+                self.workers.append(worker)
+        return worker
+
+    def close(self):
+        for worker in self.workers:
+            if not worker.replies.closed:
+                worker.close()
+
+
+def run_hook(
+    script_path: Path,
+    is_python: bool,
+    input_json: str,
+    env: dict[str, str],
+    python_workers: Optional[PythonWorkerPool] = None,
+) -> tuple[int, str, str]:
+    """
+    Run a hook on test input with env (see hook_env) and return (returncode, stdout, stderr).
+    Python hooks go through python_workers when given, each in its own forked process.
+    Raises subprocess.TimeoutExpired after 10s.
+    """
+    if is_python and python_workers is not None:
+        return python_workers.get().run(script_path, input_json, timeout=10)
+
+    proc = subprocess.run(
+        ['python3' if is_python else 'bash', str(script_path)],
+        input=input_json,
+        capture_output=True,
+        text=True,
+        timeout=10,
+        env=env,
+    )
+    return proc.returncode, proc.stdout, proc.stderr
+
+
+def validate_hook_script(
+    script_path: Path,
+    project_dir: Path,
+    event_hint: Optional[str] = None,
+    bash_syntax: Optional[dict[Path, Optional[str]]] = None,
+    python_workers: Optional[PythonWorkerPool] = None,
+    installation_index: Optional[dict[str, list[_Registration]]] = None,
+    run_runtime: bool = True,
+    env: Optional[dict[str, str]] = None,
+) -> ValidationResult:
+    """
+    Validate a single hook script and check its installation status.
+    bash_syntax holds precomputed results from check_bash_syntax_batch();
+    python_workers, if given, runs the Python runtime test without a new interpreter;
+    installation_index, if given, comes from build_installation_index();
+    run_runtime=False never executes the hook; env defaults to hook_env(project_dir).
+    """
     result = ValidationResult()
 
     # 1. Check file exists
@@ -442,12 +893,15 @@ def validate_hook_script(script_path: Path, project_dir: Path, event_hint: Optio
     else:
         result.ok("Script is executable")
 
-    # 3. Read content
+    # 3. Read content (bounded; see _HEAD_BYTES)
     try:
-        content = script_path.read_text()
+        with script_path.open("rb") as f:
+            head = f.read(_HEAD_BYTES)
     except Exception as e:
         result.error(f"Cannot read script: {e}")
         return result
+    content = head.decode("utf-8", errors="replace")
+    truncated = len(head) == _HEAD_BYTES
 
     # 4. Check shebang and determine language
     lines = content.split('\n')
@@ -472,12 +926,25 @@ def validate_hook_script(script_path: Path, project_dir: Path, event_hint: Optio
 
     # 5. Syntax check
     if is_python:
-        try:
-            ast.parse(content)
-            result.ok("Python syntax valid")
-        except SyntaxError as e:
-            result.error(f"Python syntax error: {e.msg} (line {e.lineno})")
+        # Compiling needs the whole file; once read, the heuristics below use it too
+        if truncated:
+            try:
+                content = script_path.read_bytes().decode("utf-8", errors="replace")
+            except OSError as e:
+                result.error(f"Cannot read script: {e}")
+                return result
+            truncated = False
+        syntax_error = check_python_syntax(script_path, content)
+        if syntax_error:
+            result.error(f"Python syntax error: {syntax_error}")
             return result  # Can't continue with broken syntax
+        result.ok("Python syntax valid")
+    elif is_bash and bash_syntax and script_path in bash_syntax:
+        syntax_error = bash_syntax[script_path]
+        if syntax_error:
+            result.error(f"Bash syntax error: {syntax_error}")
+        else:
+            result.ok("Bash syntax valid")
     elif is_bash:
         try:
             proc = subprocess.run(
@@ -514,6 +981,13 @@ def validate_hook_script(script_path: Path, project_dir: Path, event_hint: Optio
 
         # Check for infinite loop protection in Stop hooks
         if event in ["Stop", "SubagentStop"]:
+            if "stop_hook_active" not in content and truncated:
+                # Only the head was read; look at the rest before reporting an error
+                try:
+                    content = script_path.read_bytes().decode("utf-8", errors="replace")
+                    truncated = False
+                except OSError:
+                    pass
             if "stop_hook_active" not in content:
                 result.error("Stop hook missing stop_hook_active check (infinite loop risk!)")
             else:
@@ -522,53 +996,61 @@ def validate_hook_script(script_path: Path, project_dir: Path, event_hint: Optio
         result.warn("Could not detect event type from script content")
 
     # 8. Check exit code usage
+    exit_codes = {m.group(1) or m.group(2) for m in _EXIT_RE.finditer(content)}
     if is_python:
-        if 'sys.exit(2)' in content:
+        if '2' in exit_codes:
             result.ok("Uses exit(2) for blocking")
-        if 'sys.exit(0)' in content:
+        if '0' in exit_codes:
             result.ok("Uses exit(0) for success")
-        if 'sys.exit(1)' in content:
+        if '1' in exit_codes:
             result.warn("Uses exit(1) - non-blocking error (logged only)")
     elif is_bash:
-        if 'exit 2' in content:
+        if '2' in exit_codes:
             result.ok("Uses exit 2 for blocking")
-        if 'exit 0' in content:
+        if '0' in exit_codes:
             result.ok("Uses exit 0 for success")
 
-    # 9. Runtime test with sample input
+    # 9. Runtime test with sample input (the slowest check, so only when it can tell us something)
+    if not run_runtime:
+        result.info("Runtime test skipped (--skip-runtime)")
+        event = None
+    elif result.errors:
+        result.warn("Skipping runtime test due to earlier errors")
+        event = None
+
     if event and (is_python or is_bash):
-        test_input = TEST_INPUTS.get(event, {"hook_event_name": "Unknown"})
         try:
-            interpreter = 'python3' if is_python else 'bash'
-            proc = subprocess.run(
-                [interpreter, str(script_path)],
-                input=json.dumps(test_input),
-                capture_output=True,
-                text=True,
-                timeout=10,
-                env={**os.environ, "CLAUDE_PROJECT_DIR": str(project_dir)},
+            returncode, stdout, stderr = run_hook(
+                script_path,
+                is_python,
+                _TEST_INPUT_JSON.get(event, _UNKNOWN_INPUT_JSON),
+                env if env is not None else hook_env(project_dir),
+                python_workers,
             )
-            if proc.returncode in [0, 1, 2]:
-                result.ok(f"Runtime test passed (exit code: {proc.returncode})")
-                if proc.stdout.strip():
+            if returncode in [0, 1, 2]:
+                result.ok(f"Runtime test passed (exit code: {returncode})")
+                if stdout.strip():
                     try:
-                        json.loads(proc.stdout)
+                        json.loads(stdout)
                         result.ok("Outputs valid JSON")
                     except json.JSONDecodeError:
                         # Non-JSON output is fine for some hooks
-                        if len(proc.stdout) < 200:
-                            result.ok(f"Outputs text: {proc.stdout.strip()[:50]}")
+                        if len(stdout) < 200:
+                            result.ok(f"Outputs text: {stdout.strip()[:50]}")
             else:
-                result.error(f"Unexpected exit code: {proc.returncode}")
-            if proc.stderr.strip() and proc.returncode != 2:
-                result.warn(f"Stderr output: {proc.stderr.strip()[:100]}")
+                result.error(f"Unexpected exit code: {returncode}")
+            if stderr.strip() and returncode != 2:
+                result.warn(f"Stderr output: {stderr.strip()[:100]}")
         except subprocess.TimeoutExpired:
             result.error("Script timed out (>10s) on test input")
         except Exception as e:
             result.error(f"Runtime test failed: {e}")
 
     # 10. Check installation status
-    result.installation = check_installation_status(script_path, project_dir)
+    if installation_index is not None:
+        result.installation = lookup_installation(installation_index, script_path)
+    else:
+        result.installation = check_installation_status(script_path, project_dir)
 
     return result
 
@@ -584,7 +1066,7 @@ def validate_settings(settings_path: Path, project_dir: Path, level_name: str =
         return result
 
     try:
-        settings = json.loads(settings_path.read_text())
+        settings = load_settings(settings_path)
     except json.JSONDecodeError as e:
         result.error(f"Invalid JSON in {display_name}: {e}")
         return result
@@ -603,11 +1085,12 @@ def validate_settings(settings_path: Path, project_dir: Path, level_name: str =
             result.error(f"Unknown event type: {event}")
             continue
 
-        schema = EVENT_SCHEMAS[event]
+        has_matcher = _EVENT_HAS_MATCHER[event]
+        can_block = _EVENT_CAN_BLOCK[event]
 
         for i, config in enumerate(configs):
             # Check matcher usage
-            if "matcher" in config and not schema["has_matcher"]:
+            if "matcher" in config and not has_matcher:
                 result.warn(f"{event}[{i}]: Matcher specified but {event} doesn't support matchers")
 
             hook_list = config.get("hooks", [])
@@ -626,16 +1109,16 @@ def validate_settings(settings_path: Path, project_dir: Path, level_name: str =
 
                     # Try to find the script path in the command
                     script_path = None
-                    for part in expanded_cmd.split():
-                        if part.endswith('.py') or part.endswith('.sh'):
+                    for part in _tokenize(expanded_cmd):
+                        if part.endswith(('.py', '.sh', '.pyc')):
                             script_path = Path(part)
                             break
 
                     if script_path:
                         if script_path.exists():
                             result.ok(f"{event}: Script exists: {script_path.name}")
-                            # Check if executable
-                            if not os.access(script_path, os.X_OK):
+                            # Check if executable (bytecode is run via python3, not directly)
+                            if script_path.suffix != '.pyc' and not os.access(script_path, os.X_OK):
                                 result.error(f"{event}: Script not executable: {script_path.name}")
                         else:
                             result.error(f"{event}: Script not found: {script_path}")
@@ -648,7 +1131,7 @@ def validate_settings(settings_path: Path, project_dir: Path, level_name: str =
                         result.error(f"{event}[{i}].hooks[{j}]: Empty prompt")
                     else:
                         result.ok(f"{event}: Prompt-based hook configured")
-                        if not schema["can_block"]:
+                        if not can_block:
                             result.warn(f"{event}: Prompt hooks on {event} cannot block operations")
 
     return result
@@ -660,14 +1143,46 @@ def find_all_hooks(project_dir: Path) -> list[Path]:
     hooks_dir = project_dir / ".claude" / "hooks"
 
     if hooks_dir.exists():
-        for f in hooks_dir.iterdir():
-            if f.is_file() and (f.suffix in ['.py', '.sh'] or f.name.startswith('hook')):
-                hooks.append(f)
+        # scandir's d_type makes is_file() free for regular entries
+        with os.scandir(hooks_dir) as it:
+            for entry in it:
+                if entry.is_file() and _is_hook_name(entry.name):
+                    hooks.append(Path(entry.path))
 
     return hooks
 
 
-def validate_project(project_dir: Path) -> bool:
+def validate_hooks(
+    hooks: list[Path], project_dir: Path, event_hint: Optional[str] = None, run_runtime: bool = True
+) -> list[ValidationResult]:
+    """
+    Validate several hook scripts concurrently, returning results in input order.
+    Each validation mostly waits on child processes, so threads are enough.
+    """
+    bash_syntax = check_bash_syntax_batch([hook for hook in hooks if hook.suffix == ".sh"])
+    installation_index = build_installation_index(project_dir)
+    env = hook_env(project_dir)
+
+    # Persistent interpreters need pass_fds/select on pipes (POSIX only)
+    python_workers = PythonWorkerPool(env) if os.name == "posix" and run_runtime else None
+
+    def validate(hook: Path) -> ValidationResult:
+        return validate_hook_script(
+            hook, project_dir, event_hint, bash_syntax, python_workers, installation_index, run_runtime, env
+        )
+
+    try:
+        if len(hooks) < 2:
+            return [validate(hook) for hook in hooks]
+
+        with ThreadPoolExecutor() as executor:
+            return list(executor.map(validate, hooks))
+    finally:
+        if python_workers is not None:
+            python_workers.close()
+
+
+def validate_project(project_dir: Path, run_runtime: bool = True) -> bool:
     """Full project validation with installation status."""
     print(f"\n{'#'*60}")
     print(f"  HOOK VALIDATION: {project_dir}")
@@ -694,7 +1209,7 @@ def validate_project(project_dir: Path) -> bool:
             status = "✅" if result.success else "❌"
             print(f"  {status} {level_display}")
             for err in result.errors:
-                print(f"      {err}")
+                print(f"      {_GLYPH['error']} {err}")
         else:
             print(f"  ⚪ {level_display} (not found)")
 
@@ -708,8 +1223,7 @@ def validate_project(project_dir: Path) -> bool:
         print(f"\n📜 HOOK SCRIPTS ({len(hooks)} found)")
         print("-" * 40)
 
-        for hook in hooks:
-            result = validate_hook_script(hook, project_dir)
+        for hook, result in zip(hooks, validate_hooks(hooks, project_dir, run_runtime=run_runtime)):
             result.print_report(f"Hook: {hook.name}")
             if not result.success:
                 all_passed = False
@@ -744,53 +1258,54 @@ def main():
     parser.add_argument("--event", help="Specify event type for the hook")
     parser.add_argument("--dir", default=".", help="Project directory (default: current)")
     parser.add_argument("--json", action="store_true", help="Output results as JSON")
+    parser.add_argument("--skip-runtime", action="store_true", help="Never execute hooks (skip the runtime test)")
 
     args = parser.parse_args()
 
     project_dir = Path(args.dir).resolve()
+    full = args.project or (not args.script and not args.all and not args.settings)
 
-    if args.project or (not args.script and not args.all and not args.settings):
-        success = validate_project(project_dir)
+    if full and not args.json:
+        success = validate_project(project_dir, run_runtime=not args.skip_runtime)
         sys.exit(0 if success else 1)
 
-    if args.settings:
-        paths = get_settings_paths(project_dir)
-        all_passed = True
+    # (title, result) pairs, printed as reports or emitted as one JSON document
+    reports: list[tuple[str, ValidationResult]] = []
 
-        for level, settings_path in paths.items():
+    if full or args.settings:
+        for level, settings_path in get_settings_paths(project_dir).items():
             result = validate_settings(settings_path, project_dir, level.upper())
-            result.print_report(f"Settings: {level.upper()}")
-            if not result.success:
-                all_passed = False
+            reports.append((f"Settings: {level.upper()}", result))
 
-        sys.exit(0 if all_passed else 1)
-
-    if args.all:
+    if full or (args.all and not args.settings):
         hooks = find_all_hooks(project_dir)
-        if not hooks:
+        if not hooks and not args.json:
             print("No hooks found in .claude/hooks/")
             sys.exit(0)
 
-        all_passed = True
-        for hook in hooks:
-            result = validate_hook_script(hook, project_dir, args.event)
-            result.print_report(f"Hook: {hook.name}")
-            if not result.success:
-                all_passed = False
-
-        sys.exit(0 if all_passed else 1)
-
-    if args.script:
+        event_hint = None if full else args.event
+        for hook, result in zip(hooks, validate_hooks(hooks, project_dir, event_hint, not args.skip_runtime)):
+            reports.append((f"Hook: {hook.name}", result))
+    elif args.script and not args.settings:
         script_path = Path(args.script)
         if not script_path.is_absolute():
             script_path = project_dir / script_path
 
-        result = validate_hook_script(script_path, project_dir, args.event)
-        result.print_report(f"Hook: {script_path.name}")
-        sys.exit(0 if result.success else 1)
+        result = validate_hook_script(
+            script_path, project_dir, args.event, run_runtime=not args.skip_runtime, env=hook_env(project_dir)
+        )
+        reports.append((f"Hook: {script_path.name}", result))
+
+    if args.json:
+        # One write for the whole run instead of a print per check
+        sys.stdout.write(json.dumps(
+            [{"name": title, **result.to_dict()} for title, result in reports], indent=2
+        ) + "\n")
+    else:
+        for title, result in reports:
+            result.print_report(title)
 
-    parser.print_help()
-    sys.exit(2)
+    sys.exit(0 if all(result.success for _, result in reports) else 1)
 
 
 if __name__ == "__main__":
@@ -12,6 +12,21 @@ import re
 import sys
 
 
+# orjson is faster when installed; the stdlib json module is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _loads(data: bytes):
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def _dumps(obj) -> str:
+    return orjson.dumps(obj).decode() if orjson else json.dumps(obj)
+
+
 # Patterns for auto-approval (customize these)
 SAFE_PATTERNS = {
     "Read": {
@@ -41,45 +56,61 @@ SAFE_PATTERNS = {
     },
 }
 
+# Bash patterns fused into one alternation, compiled once, so a command is matched in one pass
+_BASH_RE = re.compile("|".join(f"(?:{pattern})" for pattern in SAFE_PATTERNS["Bash"]["commands"]))
+
+# Extensions as tuples so one str.endswith call checks them all
+_EXT_TUPLES = {tool: tuple(p.get("extensions", [])) for tool, p in SAFE_PATTERNS.items()}
+
+# Safe path substrings per tool, matched in a single pass over the path
+_PATH_RES = {
+    tool: re.compile("|".join(re.escape(path) for path in p["paths"]))
+    for tool, p in SAFE_PATTERNS.items()
+    if p.get("paths")
+}
+
 
 def should_auto_approve(tool_name: str, tool_input: dict) -> tuple[bool, str]:
     """
     Check if operation should be auto-approved.
     Returns (should_approve, reason).
     """
-    patterns = SAFE_PATTERNS.get(tool_name, {})
-
     if tool_name in ["Read", "Write", "Edit"]:
         file_path = tool_input.get("file_path", "")
 
         # Check extensions
-        for ext in patterns.get("extensions", []):
-            if file_path.endswith(ext):
-                return True, f"Safe file type: {ext}"
+        extensions = _EXT_TUPLES.get(tool_name, ())
+        if extensions and file_path.endswith(extensions):
+            ext = next(ext for ext in extensions if file_path.endswith(ext))
+            return True, f"Safe file type: {ext}"
 
         # Check paths
-        for path in patterns.get("paths", []):
-            if path in file_path:
-                return True, f"Safe path: {path}"
+        path_re = _PATH_RES.get(tool_name)
+        match = path_re.search(file_path) if path_re else None
+        if match:
+            return True, f"Safe path: {match.group(0)}"
 
     if tool_name == "Bash":
         command = tool_input.get("command", "")
 
-        for pattern in patterns.get("commands", []):
-            if re.match(pattern, command):
-                return True, f"Safe command pattern"
+        if _BASH_RE.match(command):
+            return True, f"Safe command pattern"
 
     return False, ""
 
 
 def main():
     try:
-        input_data = json.load(sys.stdin)
+        input_data = _loads(sys.stdin.buffer.read())
     except json.JSONDecodeError:
         sys.exit(0)
 
-    tool_name = input_data.get("tool_name", "")
-    tool_input = input_data.get("tool_input", {})
+    # Well-formed tool payloads always carry these keys
+    try:
+        tool_name = input_data["tool_name"]
+        tool_input = input_data["tool_input"]
+    except KeyError:
+        sys.exit(0)
 
     should_approve, reason = should_auto_approve(tool_name, tool_input)
 
@@ -92,7 +123,7 @@ def main():
             },
             "suppressOutput": True,  # Don't clutter verbose output
         }
-        print(json.dumps(output))
+        print(_dumps(output))
 
     sys.exit(0)
 
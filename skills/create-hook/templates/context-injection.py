@@ -9,9 +9,80 @@ Usage: Copy to .claude/hooks/ and customize get_context()
 
 import json
 import os
-import subprocess
 import sys
-from datetime import datetime
+
+
+# orjson is faster when installed; the stdlib json module is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _loads(data: bytes):
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def _dumps(obj) -> str:
+    return orjson.dumps(obj).decode() if orjson else json.dumps(obj)
+
+
+# Also list the last few commits at session start (costs an extra git call)
+SHOW_RECENT_COMMITS = False
+
+# Marker files that identify the project type, in priority order (customize these)
+INDICATORS = {
+    "package.json": "Node.js project",
+    "Cargo.toml": "Rust project",
+    "pyproject.toml": "Python project",
+    "go.mod": "Go project",
+    "Gemfile": "Ruby project",
+}
+_INDICATOR_NAMES = frozenset(INDICATORS)
+
+
+def _git(*args: str, check: bool = True) -> str:
+    """
+    Run git and return its stdout (stdin and stderr go to /dev/null).
+    Uses posix_spawn + a pipe rather than the full subprocess machinery where available.
+    Raises FileNotFoundError without git, and ChildProcessError on a non-zero exit if check.
+    """
+    if not hasattr(os, "posix_spawnp"):
+        import subprocess
+
+        proc = subprocess.run(
+            ["git", *args],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            errors="replace",
+        )
+        returncode, stdout = proc.returncode, proc.stdout
+    else:
+        read_fd, write_fd = os.pipe()
+        try:
+            pid = os.posix_spawnp("git", ["git", *args], os.environ, file_actions=[
+                (os.POSIX_SPAWN_OPEN, 0, os.devnull, os.O_RDONLY, 0),
+                (os.POSIX_SPAWN_DUP2, write_fd, 1),
+                (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+            ])
+        except OSError:
+            os.close(read_fd)
+            raise
+        finally:
+            os.close(write_fd)
+
+        chunks = []
+        with os.fdopen(read_fd, "rb") as pipe:
+            while chunk := pipe.read1(65536):
+                chunks.append(chunk)
+        returncode = os.waitstatus_to_exitcode(os.waitpid(pid, 0)[1])
+        stdout = b"".join(chunks).decode(errors="replace")
+
+    if check and returncode != 0:
+        raise ChildProcessError(f"git {args[0]} exited with {returncode}")
+    return stdout
 
 
 def get_session_context() -> str:
@@ -19,6 +90,9 @@ def get_session_context() -> str:
     Generate context for SessionStart.
     Called once when Claude Code starts.
     """
+    # Imported here so other events don't pay for it at startup
+    from datetime import datetime
+
     lines = []
 
     # Add current date/time
@@ -27,47 +101,47 @@ def get_session_context() -> str:
 
     # Add git status if in a repo
     try:
-        branch = subprocess.check_output(
-            ["git", "branch", "--show-current"],
-            stderr=subprocess.DEVNULL,
-            text=True,
-        ).strip()
+        # Branch, upstream ahead/behind and changed files from a single git call
+        status = _git("status", "--porcelain=v2", "--branch")
+        branch = ""
+        ahead_behind = ""
+        change_count = 0
+        # "# branch.*" lines are headers; every other line is one changed file
+        for line in status.splitlines():
+            if line.startswith("# branch.head "):
+                branch = line[len("# branch.head "):]
+            elif line.startswith("# branch.ab "):
+                ahead_behind = line[len("# branch.ab "):]
+            elif not line.startswith("#"):
+                change_count += 1
+
         lines.append(f"Git branch: {branch}")
+        if ahead_behind and ahead_behind != "+0 -0":
+            lines.append(f"Ahead/behind upstream: {ahead_behind}")
 
         # Get recent commits
-        commits = subprocess.check_output(
-            ["git", "log", "--oneline", "-3"],
-            stderr=subprocess.DEVNULL,
-            text=True,
-        ).strip()
-        if commits:
-            lines.append(f"Recent commits:\n{commits}")
+        if SHOW_RECENT_COMMITS:
+            commits = _git("log", "--oneline", "-3").strip()
+            if commits:
+                lines.append(f"Recent commits:\n{commits}")
 
         # Check for uncommitted changes
-        status = subprocess.check_output(
-            ["git", "status", "--porcelain"],
-            stderr=subprocess.DEVNULL,
-            text=True,
-        ).strip()
-        if status:
-            change_count = len(status.split("\n"))
+        if change_count:
             lines.append(f"Uncommitted changes: {change_count} files")
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    except OSError:  # no git, or not a repository
         pass
 
     # Add custom project info
     project_dir = os.environ.get("CLAUDE_PROJECT_DIR", os.getcwd())
 
-    # Check for common files
-    indicators = {
-        "package.json": "Node.js project",
-        "Cargo.toml": "Rust project",
-        "pyproject.toml": "Python project",
-        "go.mod": "Go project",
-        "Gemfile": "Ruby project",
-    }
-    for file, description in indicators.items():
-        if os.path.exists(os.path.join(project_dir, file)):
+    # Check for common files: one directory listing instead of a stat per indicator
+    try:
+        with os.scandir(project_dir) as it:
+            present = {entry.name for entry in it if entry.name in _INDICATOR_NAMES}
+    except OSError:
+        present = set()
+    for file, description in INDICATORS.items():
+        if file in present:
             lines.append(f"Project type: {description}")
             break
 
@@ -79,6 +153,8 @@ def get_prompt_context(prompt: str) -> str:
     Generate context for UserPromptSubmit.
     Called on every user message.
     """
+    from datetime import datetime
+
     lines = []
 
     # Add timestamp for each prompt
@@ -93,11 +169,14 @@ def get_prompt_context(prompt: str) -> str:
 
 def main():
     try:
-        input_data = json.load(sys.stdin)
+        input_data = _loads(sys.stdin.buffer.read())
     except json.JSONDecodeError:
         sys.exit(0)
 
-    event = input_data.get("hook_event_name", "")
+    try:
+        event = input_data["hook_event_name"]
+    except KeyError:
+        sys.exit(0)
 
     if event == "SessionStart":
         context = get_session_context()
@@ -112,10 +191,13 @@ def main():
             #         "additionalContext": context
             #     }
             # }
-            # print(json.dumps(output))
+            # print(_dumps(output))
 
     elif event == "UserPromptSubmit":
-        prompt = input_data.get("prompt", "")
+        try:
+            prompt = input_data["prompt"]
+        except KeyError:
+            sys.exit(0)
         context = get_prompt_context(prompt)
         if context:
             print(context)
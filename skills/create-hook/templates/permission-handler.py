@@ -13,9 +13,38 @@ Usage: Copy to .claude/hooks/ and customize the handle_permission() function
 
 import json
 import os
+import re
 import sys
 
 
+# orjson is faster when installed; the stdlib json module is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _loads(data: bytes):
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def _dumps(obj) -> str:
+    return orjson.dumps(obj).decode() if orjson else json.dumps(obj)
+
+
+# Substrings that get a Bash command denied outright (customize these)
+DANGEROUS_PATTERNS = ["rm -rf /", "sudo rm", "> /dev/sd", "mkfs"]
+
+# One alternation, compiled once, so each command is scanned in a single pass
+_DANGEROUS_RE = re.compile("|".join(re.escape(pattern) for pattern in DANGEROUS_PATTERNS))
+
+# Files Write may not create or overwrite (a tuple, so one endswith call checks them all)
+PROTECTED_FILES = (".env", ".env.local", "credentials.json", "secrets.yaml")
+
+# Extensions Read may open without a dialog (a set, so the lookup stays one hash probe)
+DOC_EXTENSIONS = frozenset({"md", "txt", "rst", "mdx"})
+
+
 def handle_permission(
     tool_name: str,
     tool_input: dict,
@@ -38,7 +67,7 @@ def handle_permission(
     # Example 1: Auto-approve reads of documentation files
     if tool_name == "Read":
         file_path = tool_input.get("file_path", "")
-        if file_path.endswith((".md", ".txt", ".rst", ".mdx")):
+        if file_path.rpartition(".")[2] in DOC_EXTENSIONS:
             return {
                 "behavior": "allow",
             }
@@ -55,14 +84,13 @@ def handle_permission(
     # Example 3: Deny and stop Claude for dangerous operations
     if tool_name == "Bash":
         command = tool_input.get("command", "")
-        dangerous_patterns = ["rm -rf /", "sudo rm", "> /dev/sd", "mkfs"]
-        for pattern in dangerous_patterns:
-            if pattern in command:
-                return {
-                    "behavior": "deny",
-                    "message": f"Dangerous command blocked: contains '{pattern}'",
-                    "interrupt": True,  # Stop Claude entirely
-                }
+        match = _DANGEROUS_RE.search(command)
+        if match:
+            return {
+                "behavior": "deny",
+                "message": f"Dangerous command blocked: contains '{match.group(0)}'",
+                "interrupt": True,  # Stop Claude entirely
+            }
 
     # Example 4: Modify and allow (sanitize input)
     if tool_name == "Bash":
@@ -80,14 +108,13 @@ def handle_permission(
     # Example 5: Deny with feedback (but don't stop Claude)
     if tool_name == "Write":
         file_path = tool_input.get("file_path", "")
-        protected = [".env", ".env.local", "credentials.json", "secrets.yaml"]
-        for p in protected:
-            if file_path.endswith(p):
-                return {
-                    "behavior": "deny",
-                    "message": f"Cannot write to protected file: {p}. Use environment variables instead.",
-                    "interrupt": False,  # Claude can try alternative approach
-                }
+        if file_path.endswith(PROTECTED_FILES):
+            p = next(p for p in PROTECTED_FILES if file_path.endswith(p))
+            return {
+                "behavior": "deny",
+                "message": f"Cannot write to protected file: {p}. Use environment variables instead.",
+                "interrupt": False,  # Claude can try alternative approach
+            }
 
     # Return None to show normal permission dialog
     return None
@@ -95,12 +122,16 @@ def handle_permission(
 
 def main():
     try:
-        input_data = json.load(sys.stdin)
+        input_data = _loads(sys.stdin.buffer.read())
     except json.JSONDecodeError:
         sys.exit(0)
 
-    tool_name = input_data.get("tool_name", "")
-    tool_input = input_data.get("tool_input", {})
+    # Well-formed tool payloads always carry these keys
+    try:
+        tool_name = input_data["tool_name"]
+        tool_input = input_data["tool_input"]
+    except KeyError:
+        sys.exit(0)
     permission_mode = input_data.get("permission_mode", "default")
 
     decision = handle_permission(tool_name, tool_input, permission_mode)
@@ -112,7 +143,7 @@ def main():
                 "decision": decision,
             }
         }
-        print(json.dumps(output))
+        print(_dumps(output))
 
     sys.exit(0)
 
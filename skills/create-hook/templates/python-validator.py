@@ -12,6 +12,35 @@ import re
 import sys
 
 
+# orjson is faster when installed; the stdlib json module is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _loads(data: bytes):
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+# Bash patterns to block (customize these)
+DANGEROUS_COMMANDS = [
+    r"\brm\s+-rf\s+/",
+    r"\bsudo\b",
+    r">\s*/dev/",
+    r"\bdd\s+.*of=/dev/",
+]
+
+# One alternation, compiled once, so each command is scanned in a single pass
+_DANGEROUS_RE = re.compile("|".join(f"(?:{pattern})" for pattern in DANGEROUS_COMMANDS))
+
+# Path substrings that Write may not touch (customize these)
+SENSITIVE_PATHS = [".env", "credentials", "secrets", ".git/"]
+
+# All substrings matched in one pass over the path
+_SENSITIVE_RE = re.compile("|".join(re.escape(pattern) for pattern in SENSITIVE_PATHS))
+
+
 def validate_tool_input(tool_name: str, tool_input: dict) -> tuple[bool, str]:
     """
     Validate tool input. Return (is_valid, error_message).
@@ -22,17 +51,9 @@ def validate_tool_input(tool_name: str, tool_input: dict) -> tuple[bool, str]:
     if tool_name == "Bash":
         command = tool_input.get("command", "")
 
-        # Block dangerous patterns
-        dangerous = [
-            r"\brm\s+-rf\s+/",
-            r"\bsudo\b",
-            r">\s*/dev/",
-            r"\bdd\s+.*of=/dev/",
-        ]
-
-        for pattern in dangerous:
-            if re.search(pattern, command):
-                return False, f"Command blocked: matches dangerous pattern"
+        # Block dangerous patterns (see DANGEROUS_COMMANDS)
+        if _DANGEROUS_RE.search(command):
+            return False, f"Command blocked: matches dangerous pattern"
 
         # Require description for complex commands
         if "|" in command or "&&" in command:
@@ -43,11 +64,10 @@ def validate_tool_input(tool_name: str, tool_input: dict) -> tuple[bool, str]:
     if tool_name == "Write":
         file_path = tool_input.get("file_path", "")
 
-        # Block writes to sensitive files
-        sensitive = [".env", "credentials", "secrets", ".git/"]
-        for pattern in sensitive:
-            if pattern in file_path:
-                return False, f"Cannot write to sensitive path: {pattern}"
+        # Block writes to sensitive files (see SENSITIVE_PATHS)
+        match = _SENSITIVE_RE.search(file_path)
+        if match:
+            return False, f"Cannot write to sensitive path: {match.group(0)}"
 
     # Example: Validate Edit tool
     if tool_name == "Edit":
@@ -62,13 +82,17 @@ def validate_tool_input(tool_name: str, tool_input: dict) -> tuple[bool, str]:
 
 def main():
     try:
-        input_data = json.load(sys.stdin)
+        input_data = _loads(sys.stdin.buffer.read())
     except json.JSONDecodeError as e:
         print(f"Error: Invalid JSON input: {e}", file=sys.stderr)
         sys.exit(1)
 
-    tool_name = input_data.get("tool_name", "")
-    tool_input = input_data.get("tool_input", {})
+    # Well-formed tool payloads always carry these keys
+    try:
+        tool_name = input_data["tool_name"]
+        tool_input = input_data["tool_input"]
+    except KeyError:
+        sys.exit(0)
 
     is_valid, error_message = validate_tool_input(tool_name, tool_input)
 
@@ -9,8 +9,148 @@ Usage: Copy to .claude/hooks/ and customize check_completion()
 
 import json
 import os
-import subprocess
 import sys
+import time
+
+
+# orjson is faster when installed; the stdlib json module is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _loads(data: bytes):
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def _dumps(obj) -> str:
+    return orjson.dumps(obj).decode() if orjson else json.dumps(obj)
+
+
+# Reuse a lint result across Stop events this close together (seconds).
+# The cache is dropped when HEAD moves or the index is written, but not when the
+# working tree is edited: a lint run up to CACHE_TTL seconds old may be reused
+# after further edits. Set to 0 to always lint.
+CACHE_TTL = 10
+
+
+def _cache_key(git_dir: str) -> list[int]:
+    """Changes whenever HEAD moves or the index is written (commit, add, ...)."""
+    key = []
+    for name in ("index", "HEAD"):
+        try:
+            key.append(os.stat(os.path.join(git_dir, name)).st_mtime_ns)
+        except OSError:
+            key.append(0)
+    return key
+
+
+def _cached(project_dir: str, name: str, compute):
+    """
+    Return compute() for this check, reusing a result stored by a recent Stop event.
+    The cache lives in the repository's git dir, so only its owner can write it.
+    Exceptions from compute() propagate and are not cached.
+    """
+    if CACHE_TTL <= 0:
+        return compute()
+    try:
+        git_dir = _git("-C", project_dir, "rev-parse", "--absolute-git-dir").strip()
+    except OSError:  # no git, or not a repository: nowhere safe to cache
+        return compute()
+
+    path = os.path.join(git_dir, "claude-stop-cache.json")
+    key = _cache_key(git_dir)
+    try:
+        with open(path) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        cache = {}
+    if not isinstance(cache, dict) or cache.get("key") != key:
+        cache = {"key": key, "entries": {}}
+
+    entry = cache["entries"].get(name)
+    # Entries stamped in the future are never trusted
+    if entry and 0 <= time.time() - entry["time"] < CACHE_TTL:
+        return entry["value"]
+
+    value = compute()
+    cache["entries"][name] = {"time": time.time(), "value": value}
+    try:
+        tmp = f"{path}.{os.getpid()}"
+        with open(tmp, "w") as f:
+            json.dump(cache, f)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+    return value
+
+
+def _git(*args: str, check: bool = True) -> str:
+    """
+    Run git and return its stdout (stdin and stderr go to /dev/null).
+    Uses posix_spawn + a pipe rather than the full subprocess machinery where available.
+    Raises FileNotFoundError without git, and ChildProcessError on a non-zero exit if check.
+    """
+    if not hasattr(os, "posix_spawnp"):
+        import subprocess
+
+        proc = subprocess.run(
+            ["git", *args],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            errors="replace",
+        )
+        returncode, stdout = proc.returncode, proc.stdout
+    else:
+        read_fd, write_fd = os.pipe()
+        try:
+            pid = os.posix_spawnp("git", ["git", *args], os.environ, file_actions=[
+                (os.POSIX_SPAWN_OPEN, 0, os.devnull, os.O_RDONLY, 0),
+                (os.POSIX_SPAWN_DUP2, write_fd, 1),
+                (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+            ])
+        except OSError:
+            os.close(read_fd)
+            raise
+        finally:
+            os.close(write_fd)
+
+        chunks = []
+        with os.fdopen(read_fd, "rb") as pipe:
+            while chunk := pipe.read1(65536):
+                chunks.append(chunk)
+        returncode = os.waitstatus_to_exitcode(os.waitpid(pid, 0)[1])
+        stdout = b"".join(chunks).decode(errors="replace")
+
+    if check and returncode != 0:
+        raise ChildProcessError(f"git {args[0]} exited with {returncode}")
+    return stdout
+
+
+def _status_entries(status: str) -> list[str]:
+    """
+    Split `git status --porcelain=v2 -z` output into one entry per changed file.
+    -z leaves paths unquoted; a rename/copy (type 2) carries its source path as
+    the next NUL-separated field, which is skipped here.
+    """
+    entries = []
+    fields = iter(status.split("\0"))
+    for entry in fields:
+        if not entry:
+            continue
+        entries.append(entry)
+        if entry[0] == "2":
+            next(fields, None)
+    return entries
+
+
+def _changed_path(entry: str) -> str:
+    """Path from a `git status --porcelain=v2 -z` entry for a tracked file (types 1, 2, u)."""
+    fields = {"1": 8, "2": 9, "u": 10}[entry[0]]
+    return entry.split(" ", fields)[fields]
 
 
 def check_completion(transcript_path: str, stop_hook_active: bool) -> tuple[bool, str]:
@@ -25,85 +165,92 @@ def check_completion(transcript_path: str, stop_hook_active: bool) -> tuple[bool
     if stop_hook_active:
         return True, ""
 
+    # Imported only once we know the checks will run
+    import subprocess
+
     # Example checks (customize these):
 
+    project_dir = os.environ.get("CLAUDE_PROJECT_DIR", os.getcwd())
+
     # 1. Check if tests were run
     # Look for test commands in recent transcript
     # (In real implementation, you'd parse transcript_path)
 
-    # 2. Check for uncommitted changes
+    # 2. Check for TODO comments in modified files (tracked changes, like git diff HEAD)
+    # One git status call lists the modified files here and drives check 3. This
+    # runs first, because any modified file also counts as an uncommitted change.
     try:
-        status = subprocess.check_output(
-            ["git", "status", "--porcelain"],
-            stderr=subprocess.DEVNULL,
-            text=True,
-        ).strip()
-        if status:
-            return False, (
-                "You have uncommitted changes. Please commit your work:\n"
-                f"Files changed: {len(status.split(chr(10)))}\n"
-                "Run: git add . && git commit -m 'your message'"
-            )
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        pass
+        entries = _status_entries(_git("status", "--porcelain=v2", "-z"))
+    except OSError:  # no git, or not a repository
+        entries = []
+    diff_files = [_changed_path(entry) for entry in entries if entry[0] in "12u"]
 
-    # 3. Check for lint errors (example for JS/TS projects)
-    project_dir = os.environ.get("CLAUDE_PROJECT_DIR", os.getcwd())
+    # git grep scans the files in C; -z keeps odd file names unambiguous, -I skips binaries
+    if diff_files:
+        try:
+            # Exit status 1 just means no matches
+            grep = _git("--literal-pathspecs", "grep", "-z", "-n", "-I", "-F", "-e", "TODO", "--", *diff_files, check=False)
+            # Records end in "\n" only; splitlines() would also break on \x0b, \x85, ...
+            for match in grep.split("\n"):
+                if not match:
+                    continue
+                file, i, line = match.split("\0", 2)
+                if "# TODO:" not in line:
+                    return False, (
+                        f"Found TODO in {file}:{i}\n"
+                        f"Please address before finishing:\n"
+                        f"  {line.strip()}"
+                    )
+        except OSError:
+            pass
+
+    # 3. Check for uncommitted changes
+    if entries:
+        return False, (
+            "You have uncommitted changes. Please commit your work:\n"
+            f"Files changed: {len(entries)}\n"
+            "Run: git add . && git commit -m 'your message'"
+        )
+
+    # 4. Check for lint errors (example for JS/TS projects)
     package_json = os.path.join(project_dir, "package.json")
 
+    def run_lint() -> list:
+        result = subprocess.run(
+            ["npm", "run", "lint", "--", "--quiet"],
+            cwd=project_dir,
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+        return [result.returncode, result.stderr[:500] if result.stderr else result.stdout[:500]]
+
     if os.path.exists(package_json):
         try:
-            result = subprocess.run(
-                ["npm", "run", "lint", "--", "--quiet"],
-                cwd=project_dir,
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
-            if result.returncode != 0:
+            returncode, lint_output = _cached(project_dir, "lint", run_lint)
+            if returncode != 0:
                 return False, (
                     "Lint errors detected. Please fix them before finishing:\n"
-                    f"{result.stderr[:500] if result.stderr else result.stdout[:500]}"
+                    f"{lint_output}"
                 )
         except (subprocess.TimeoutExpired, FileNotFoundError):
             pass
 
-    # 4. Check for TODO comments in modified files
-    try:
-        diff_files = subprocess.check_output(
-            ["git", "diff", "--name-only", "HEAD"],
-            stderr=subprocess.DEVNULL,
-            text=True,
-        ).strip().split("\n")
-
-        for file in diff_files:
-            if not file or not os.path.exists(file):
-                continue
-            try:
-                with open(file) as f:
-                    for i, line in enumerate(f, 1):
-                        if "TODO" in line and "# TODO:" not in line:
-                            return False, (
-                                f"Found TODO in {file}:{i}\n"
-                                f"Please address before finishing:\n"
-                                f"  {line.strip()}"
-                            )
-            except (IOError, UnicodeDecodeError):
-                pass
-    except subprocess.CalledProcessError:
-        pass
-
     return True, ""
 
 
 def main():
     try:
-        input_data = json.load(sys.stdin)
+        input_data = _loads(sys.stdin.buffer.read())
     except json.JSONDecodeError:
         sys.exit(0)
 
+    # stop_hook_active is always sent; transcript_path is optional
+    try:
+        stop_hook_active = input_data["stop_hook_active"]
+    except KeyError:
+        sys.exit(0)
     transcript_path = input_data.get("transcript_path", "")
-    stop_hook_active = input_data.get("stop_hook_active", False)
 
     can_stop, reason = check_completion(transcript_path, stop_hook_active)
 
@@ -113,7 +260,7 @@ def main():
             "decision": "block",
             "reason": reason,
         }
-        print(json.dumps(output))
+        print(_dumps(output))
 
     sys.exit(0)
 